@@ -2,13 +2,21 @@
 from __future__ import annotations
 
 import copy
-from typing import Any, Callable, Generic, Tuple, TypeVar, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Literal,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import numpy as np
 import sklearn.neighbors
 from scipy.sparse import csr_matrix
 from sklearn.utils.validation import check_is_fitted as sklearn_check_is_fitted
-from typing_extensions import Literal
 
 from skfda.misc.metrics._utils import PairwiseMetric
 
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import functools
 import numbers
+import sys
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Iterable,
     List,
+    Literal,
     Optional,
+    Protocol,
     Sequence,
     Sized,
     Tuple,
@@ -26,12 +29,16 @@ import scipy.integrate
 from pandas.api.indexers import check_array_indexer
 from sklearn.preprocessing import LabelEncoder
 from sklearn.utils.multiclass import check_classification_targets
-from typing_extensions import Literal, ParamSpec, Protocol
 
 from ..typing._base import GridPoints, GridPointsLike
 from ..typing._numpy import NDArrayAny, NDArrayFloat, NDArrayInt, NDArrayStr
 from ._sklearn_adapter import BaseEstimator
 
+if sys.version_info >= (3, 10):
+    from typing import ParamSpec
+else:
+    from typing_extensions import ParamSpec
+
 ArrayDTypeT = TypeVar("ArrayDTypeT", bound="np.generic")
 
 if TYPE_CHECKING:
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import warnings
-from typing import Any, Mapping, Tuple, overload
+from typing import Any, Literal, Mapping, Tuple, overload
 
 import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 from sklearn.utils import Bunch
-from typing_extensions import Literal
 
 import rdata
 
@@ -68,15 +68,7 @@ class IntegratedDepth(Depth[FDataGrid]):
         y: object = None,
     ) -> IntegratedDepth:
 
-        self.multivariate_depth_: Depth[NDArrayFloat]
-
-        if self.multivariate_depth is None:
-            self.multivariate_depth_ = _UnivariateFraimanMuniz()
-        else:
-            self.multivariate_depth_ = self.multivariate_depth
-
-        self._domain_range = X.domain_range
-        self._grid_points = X.grid_points
+        self._init_multivariate_depth(X)
         self.multivariate_depth_.fit(X.data_matrix)
         return self
 
@@ -88,6 +80,34 @@ class IntegratedDepth(Depth[FDataGrid]):
 
         return average_function_value(pointwise_depth).ravel()
 
+    def fit_transform(  # noqa: D102
+        self,
+        X: FDataGrid,
+        y: object = None,
+    ) -> NDArrayFloat:
+
+        # Let the multivariate depth exploit that the observations are the
+        # distribution itself, fitting it only once
+        self._init_multivariate_depth(X)
+
+        pointwise_depth = X.copy(
+            data_matrix=self.multivariate_depth_.fit_transform(X.data_matrix),
+        )
+
+        return average_function_value(pointwise_depth).ravel()
+
+    def _init_multivariate_depth(self, X: FDataGrid) -> None:
+
+        self.multivariate_depth_: Depth[NDArrayFloat]
+
+        if self.multivariate_depth is None:
+            self.multivariate_depth_ = _UnivariateFraimanMuniz()
+        else:
+            self.multivariate_depth_ = self.multivariate_depth
+
+        self._domain_range = X.domain_range
+        self._grid_points = X.grid_points
+
     @property
     def max(self) -> float:
         if self.multivariate_depth is None:
@@ -181,26 +201,25 @@ class BandDepth(Depth[FDataGrid]):
 
     def transform(self, X: FDataGrid) -> NDArrayFloat:  # noqa: D102
 
-        num_in = np.zeros(shape=len(X), dtype=X.data_matrix.dtype)
+        data_matrix = X.data_matrix
+        num_in = np.zeros(shape=len(X), dtype=data_matrix.dtype)
         n_total = 0
-
-        for f1, f2 in itertools.combinations(self._distribution, 2):
-            between_range_1 = (
-                (f1.data_matrix <= X.data_matrix)
-                & (X.data_matrix <= f2.data_matrix)
-            )
-
-            between_range_2 = (
-                (f2.data_matrix <= X.data_matrix)
-                & (X.data_matrix <= f1.data_matrix)
-            )
-
-            between_range = between_range_1 | between_range_2
-
-            num_in += np.all(
-                between_range,
-                axis=tuple(range(1, X.data_matrix.ndim)),
-            )
+        axis = tuple(range(1, data_matrix.ndim))
+
+        # Iterate over the arrays instead of creating a FDataGrid per sample
+        for f1, f2 in itertools.combinations(
+            self._distribution.data_matrix,
+            2,
+        ):
+            # The band limits only depend on the pair, so computing them
+            # first halves the passes over the data of the observations
+            lower = np.minimum(f1, f2)
+            upper = np.maximum(f1, f2)
+
+            between_range = lower <= data_matrix
+            between_range &= data_matrix <= upper
+
+            num_in += np.all(between_range, axis=axis)
             n_total += 1
 
         return num_in / n_total
@@ -4,13 +4,11 @@ from __future__ import annotations
 
 import abc
 import math
-from typing import TypeVar
+from typing import Literal, Tuple, TypeVar
 
 import numpy as np
 import scipy.stats
 import sklearn
-from scipy.special import comb
-from typing_extensions import Literal
 
 from ..._utils._sklearn_adapter import BaseEstimator, InductiveTransformerMixin
 from ...typing._numpy import NDArrayFloat, NDArrayInt
@@ -153,28 +151,87 @@ def _searchsorted_ordered(
     )
 
 
-def _cumulative_distribution(column: NDArrayFloat) -> NDArrayFloat:
+_RankMethod = Literal["min", "max"]
+
+
+def _rank_samples_minmax(
+    data: NDArrayFloat,
+) -> Tuple[NDArrayInt, NDArrayInt]:
     """
-    Calculate the cumulative distribution function at each point.
+    Rank the samples along the first axis, with both ways of breaking ties.
+
+    It is equivalent to :func:`scipy.stats.rankdata` along the first axis
+    with the ``'min'`` and ``'max'`` methods, but the ranks of all columns
+    are computed at once, from a single sort.
 
     Args:
-        column: Array containing the values over which the
-            distribution function is calculated.
+        data: Array whose columns along the first axis are ranked.
 
     Returns:
-        Array containing the evaluation at each point of the
-        distribution function.
+        Tuple containing the ranks of each value in its column when tied
+        values receive the minimum of their ranks (one more than the
+        number of values strictly less than them) and the maximum (the
+        number of values less or equal than them), respectively.
 
     Examples:
-        >>> _cumulative_distribution(np.array([1, 4, 5, 1, 2, 2, 4, 1, 1, 3]))
-        array([ 0.4,  0.9,  1. ,  0.4,  0.6,  0.6,  0.9,  0.4,  0.4,  0.7])
+        >>> ranks_min, ranks_max = _rank_samples_minmax(
+        ...     np.array([1, 4, 5, 1, 2, 2, 4, 1, 1, 3]),
+        ... )
+        >>> ranks_min
+        array([ 1,  8, 10,  1,  5,  5,  8,  1,  1,  7])
+        >>> ranks_max
+        array([ 4,  9, 10,  4,  6,  6,  9,  4,  4,  7])
+
+    """
+    order, sorted_data = _sort_samples(data)
+    return (
+        _ranks_from_sort(order, sorted_data, method='min'),
+        _ranks_from_sort(order, sorted_data, method='max'),
+    )
+
+
+def _sort_samples(data: NDArrayFloat) -> Tuple[NDArrayInt, NDArrayFloat]:
+    """
+    Sort the samples along the first axis.
+
+    Returns:
+        Tuple containing the sorting indexes and the sorted data.
 
     """
-    return _searchsorted_ordered(
-        np.sort(column),
-        column,
-        side='right',
-    ) / len(column)
+    order = np.argsort(data, axis=0)
+    return order, np.take_along_axis(data, order, axis=0)
+
+
+def _ranks_from_sort(
+    order: NDArrayInt,
+    sorted_data: NDArrayFloat,
+    *,
+    method: _RankMethod,
+) -> NDArrayInt:
+    """Compute the ranks from the output of :func:`_sort_samples`."""
+    n_samples = len(order)
+    positions = np.arange(1, n_samples + 1).reshape(
+        (-1,) + (1,) * (order.ndim - 1),
+    )
+
+    # Mark the boundaries of the runs of tied values in the sorted data
+    # and propagate the rank of the boundary to the whole run
+    boundaries = np.empty(order.shape, dtype=np.bool_)
+    if method == 'max':
+        boundaries[-1] = True
+        np.not_equal(sorted_data[1:], sorted_data[:-1], out=boundaries[:-1])
+        sorted_ranks = np.where(boundaries, positions, n_samples)
+        sorted_ranks = np.minimum.accumulate(sorted_ranks[::-1], axis=0)[::-1]
+    else:
+        boundaries[0] = True
+        np.not_equal(sorted_data[1:], sorted_data[:-1], out=boundaries[1:])
+        sorted_ranks = np.where(boundaries, positions, 1)
+        sorted_ranks = np.maximum.accumulate(sorted_ranks, axis=0)
+
+    ranks = np.empty_like(sorted_ranks)
+    np.put_along_axis(ranks, order, sorted_ranks, axis=0)
+
+    return ranks
 
 
 class _UnivariateFraimanMuniz(Depth[NDArrayFloat]):
@@ -198,24 +255,82 @@ class _UnivariateFraimanMuniz(Depth[NDArrayFloat]):
         return self
 
     def transform(self, X: NDArrayFloat) -> NDArrayFloat:
-        cum_dist = _searchsorted_ordered(
+        positions = _searchsorted_ordered(
             np.moveaxis(self._sorted_values, 0, -1),
             np.moveaxis(X, 0, -1),
             side='right',
-        ).astype(X.dtype) / len(self._sorted_values)
+        )
+
+        # Divide directly into a buffer of the final type, instead of
+        # converting the positions first
+        cum_dist = np.true_divide(
+            positions,
+            len(self._sorted_values),
+            dtype=np.result_type(X.dtype, 1.0),
+        )
+
+        return self._depth_from_distribution(np.moveaxis(cum_dist, -1, 0))
+
+    def fit_transform(self, X: NDArrayFloat, y: object = None) -> NDArrayFloat:
+        # When the observations are the distribution itself, their
+        # distribution function can be obtained directly from their ranks,
+        # reusing the sort needed for fitting
+        order, self._sorted_values = _sort_samples(X)
+        ranks = _ranks_from_sort(order, self._sorted_values, method='max')
+        cum_dist = np.true_divide(
+            ranks,
+            len(X),
+            dtype=np.result_type(X.dtype, 1.0),
+        )
+
+        return self._depth_from_distribution(cum_dist)
+
+    def _depth_from_distribution(
+        self,
+        cum_dist: NDArrayFloat,
+    ) -> NDArrayFloat:
+        assert cum_dist.shape[-1] == 1
 
-        assert cum_dist.shape[-2] == 1
-        ret = 0.5 - np.moveaxis(cum_dist, -1, 0)[..., 0]
-        ret = - np.abs(ret)
-        ret += 1
+        # The distribution function is no longer needed, so its buffer is
+        # reused to compute the depth in place
+        depth = cum_dist[..., 0]
+        depth -= 0.5
+        np.abs(depth, out=depth)
+        np.subtract(1, depth, out=depth)
 
-        return ret
+        return depth
 
     @property
     def min(self) -> float:
         return 1 / 2
 
 
+def _simplicial_depth_from_counts(
+    num_strictly_below: NDArrayInt,
+    num_strictly_above: NDArrayInt,
+    n_samples: int,
+) -> NDArrayFloat:
+    """
+    Compute the univariate simplicial depth from the sample counts.
+
+    The array ``num_strictly_above`` is used as scratch space and
+    overwritten, so that the depth is computed with a single new buffer.
+
+    """
+    # Compute 1 - (comb(below, 2) + comb(above, 2)) / comb(n, 2)
+    # in place, to avoid allocating a temporary array per operation.
+    # The factor 1/2 of each combinatorial number cancels out, and
+    # above * (above - 1) is computed as above**2 - above.
+    depth = num_strictly_below - 1.0
+    depth *= num_strictly_below
+    depth -= num_strictly_above
+    depth += np.square(num_strictly_above, out=num_strictly_above)
+    depth /= -n_samples * (n_samples - 1)
+    depth += 1
+
+    return depth
+
+
 class SimplicialDepth(Depth[NDArrayFloat]):
     r"""
     Simplicial depth.
@@ -236,18 +351,20 @@ class SimplicialDepth(Depth[NDArrayFloat]):
         X: NDArrayFloat,
         y: object = None,
     ) -> SimplicialDepth:
+        self._check_dim(X)
+        self.sorted_values = np.sort(X, axis=0)
+
+        return self
+
+    def _check_dim(self, X: NDArrayFloat) -> None:
         self._dim = X.shape[-1]
 
-        if self._dim == 1:
-            self.sorted_values = np.sort(X, axis=0)
-        else:
+        if self._dim != 1:
             raise NotImplementedError(
                 "SimplicialDepth is currently only "
                 "implemented for one-dimensional data.",
             )
 
-        return self
-
     def transform(self, X: NDArrayFloat) -> NDArrayFloat:  # noqa: D102
 
         assert self._dim == X.shape[-1]
@@ -271,12 +388,43 @@ class SimplicialDepth(Depth[NDArrayFloat]):
             num_strictly_below = positions_left
             num_strictly_above = len(self.sorted_values) - positions_right
 
-            total_pairs = comb(len(self.sorted_values), 2)
+        return _simplicial_depth_from_counts(
+            num_strictly_below,
+            num_strictly_above,
+            len(self.sorted_values),
+        )
+
+    def fit_transform(  # noqa: D102
+        self,
+        X: NDArrayFloat,
+        y: object = None,
+    ) -> NDArrayFloat:
 
-        return (  # type: ignore[no-any-return]
-            total_pairs - comb(num_strictly_below, 2)
-            - comb(num_strictly_above, 2)
-        ) / total_pairs
+        self._check_dim(X)
+
+        # When the observations are the distribution itself, the counts
+        # follow from their ranks, without searching in the sorted values.
+        # Both ranks and the fitted values share the same sort.
+        order, self.sorted_values = _sort_samples(X)
+        n_samples = len(X)
+        num_strictly_below = _ranks_from_sort(
+            order,
+            self.sorted_values,
+            method='min',
+        )[..., 0]
+        num_strictly_above = _ranks_from_sort(
+            order,
+            self.sorted_values,
+            method='max',
+        )[..., 0]
+        num_strictly_below -= 1
+        np.subtract(n_samples, num_strictly_above, out=num_strictly_above)
+
+        return _simplicial_depth_from_counts(
+            num_strictly_below,
+            num_strictly_above,
+            n_samples,
+        )
 
 
 class OutlyingnessBasedDepth(Depth[T]):
@@ -3,10 +3,13 @@ from __future__ import annotations
 import numpy as np
 
 from ..._utils._sklearn_adapter import BaseEstimator, OutlierMixin
+from ..._utils.ndfunction import average_function_value
 from ...representation import FDataGrid
 from ...typing._numpy import NDArrayFloat, NDArrayInt
-from ..depth._depth import ModifiedBandDepth
-from ..stats import modified_epigraph_index
+from ..depth.multivariate import (
+    _rank_samples_minmax,
+    _simplicial_depth_from_counts,
+)
 
 
 class OutliergramOutlierDetector(
@@ -80,8 +83,35 @@ class OutliergramOutlierDetector(
         X: FDataGrid,
         y: object = None,
     ) -> OutliergramOutlierDetector:
-        self.mbd_ = ModifiedBandDepth()(X)
-        self.mei_ = modified_epigraph_index(X)
+        if X.dim_codomain != 1:
+            raise NotImplementedError(
+                "The outliergram is only implemented for univariate "
+                "functions.",
+            )
+
+        # Both the MBD and the MEI can be derived from the ranks of the
+        # samples at each point, so these are only computed once
+        n_samples = X.n_samples
+        ranks_min, ranks_max = _rank_samples_minmax(X.data_matrix)
+
+        # Number of samples greater or equal, excluding itself
+        num_above_or_equal = n_samples - ranks_min
+
+        # Same computation as ModifiedBandDepth, that is, the integral of
+        # SimplicialDepth.fit_transform, so changes to any of them must
+        # be kept in sync
+        self.mbd_ = average_function_value(
+            X.copy(
+                data_matrix=_simplicial_depth_from_counts(
+                    ranks_min - 1,
+                    n_samples - ranks_max,
+                    n_samples,
+                ),
+            ),
+        ).ravel()
+        self.mei_ = average_function_value(
+            X.copy(data_matrix=num_above_or_equal),
+        ).ravel() / n_samples
         self.parabola_ = self._compute_parabola(X)
         self.distances_ = self.parabola_ - self.mbd_
         self.max_inlier_distance_ = self._compute_maximum_inlier_distance(
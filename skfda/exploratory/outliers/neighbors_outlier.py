@@ -1,11 +1,10 @@
 """Neighbors outlier detection methods."""
 from __future__ import annotations
 
-from typing import Any, TypeVar, Union, overload
+from typing import Any, Literal, TypeVar, Union, overload
 
 from sklearn.base import OutlierMixin
 from sklearn.neighbors import LocalOutlierFactor as _LocalOutlierFactor
-from typing_extensions import Literal
 
 from ..._utils._neighbors_base import AlgorithmType, KNeighborsMixin
 from ...misc.metrics import PairwiseMetric, l2_distance
@@ -113,8 +113,8 @@ class ParametricPlot(BasePlot):
                     color_dict["color"] = sample_colors[i]
 
                 self.artists[i, 0] = ax.plot(
-                    self.fd_final.data_matrix[i][:, 0].tolist(),
-                    self.fd_final.data_matrix[i][:, 1].tolist(),
+                    self.fd_final.data_matrix[i][:, 0],
+                    self.fd_final.data_matrix[i][:, 1],
                     **color_dict,
                 )[0]
 
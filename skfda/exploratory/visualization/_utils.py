@@ -4,16 +4,18 @@ import io
 import math
 import re
 from itertools import repeat
-from typing import Sequence, Tuple, TypeVar, Union
+from typing import TYPE_CHECKING, Protocol, Sequence, Tuple, TypeVar, Union
 
 import matplotlib.backends.backend_svg
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
-from typing_extensions import Protocol, TypeAlias
 
 from ...representation._functional_data import FData
 
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
 non_close_text = '[^>]*?'
 svg_width_regex = re.compile(
     f'(<svg {non_close_text}width="){non_close_text}("{non_close_text}>)',
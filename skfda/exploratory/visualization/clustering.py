@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Sequence, Tuple
+from typing import Protocol, Sequence, Tuple
 
 import matplotlib
 import matplotlib.patches as mpatches
@@ -16,7 +16,6 @@ from matplotlib.patches import Rectangle
 from matplotlib.ticker import MaxNLocator
 from sklearn.exceptions import NotFittedError
 from sklearn.utils.validation import check_is_fitted
-from typing_extensions import Protocol
 
 from ...misc.validation import check_fdata_same_dimensions
 from ...representation import FData, FDataGrid
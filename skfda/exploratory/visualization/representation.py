@@ -8,7 +8,7 @@ like depth measures.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Sequence, Sized, Tuple, TypeVar
+from typing import Any, Dict, Protocol, Sequence, Sized, Tuple, TypeVar
 
 import matplotlib.cm
 import matplotlib.patches
@@ -17,7 +17,6 @@ from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 from matplotlib.colors import Colormap
 from matplotlib.figure import Figure
-from typing_extensions import Protocol
 
 from ..._utils import _to_grid_points, constants
 from ...misc.validation import validate_domain_range
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from typing import Sequence, Tuple, TypeVar, overload
+from typing import Literal, Sequence, Tuple, TypeVar, overload
 
 import numpy as np
-from typing_extensions import Literal
 
 from ..._utils import constants
 from ...datasets import make_gaussian
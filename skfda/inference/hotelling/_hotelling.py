@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import itertools
-from typing import Tuple, overload
+from typing import Literal, Tuple, overload
 
 import numpy as np
 import scipy.special
-from typing_extensions import Literal
 
 from ...misc.validation import validate_random_state
 from ...representation import FData, FDataBasis, FDataGrid
@@ -1,11 +1,10 @@
 """Methods to solve least squares problems."""
 from __future__ import annotations
 
-from typing import Callable, Optional, Union
+from typing import Callable, Final, Literal, Optional, Union
 
 import numpy as np
 import scipy.linalg
-from typing_extensions import Final, Literal
 
 from ..typing._numpy import NDArrayFloat
 
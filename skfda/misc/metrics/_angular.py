@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, TypeVar, Union
+from typing import Final, Optional, TypeVar, Union
 
 import numpy as np
-from typing_extensions import Final
 
 from ...representation import FData
 from ...typing._numpy import NDArrayFloat
@@ -1,11 +1,10 @@
 """Elastic metrics."""
 from __future__ import annotations
 
-from typing import Any, Optional, Tuple, TypeVar
+from typing import Any, Final, Optional, Tuple, TypeVar
 
 import numpy as np
 import scipy.integrate
-from typing_extensions import Final
 
 from ..._utils import normalize_scale, normalize_warping
 from ...representation import FData, FDataGrid
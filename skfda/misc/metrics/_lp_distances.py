@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import math
-from typing import Optional, TypeVar, Union
+from typing import Final, Optional, TypeVar, Union
 
 import numpy as np
-from typing_extensions import Final
 
 from ...representation import FData
 from ...typing._metric import Norm
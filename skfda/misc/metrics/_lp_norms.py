@@ -1,11 +1,10 @@
 """Implementation of Lp norms."""
 import math
 from builtins import isinstance
-from typing import Union
+from typing import Final, Union
 
 import numpy as np
 import scipy.integrate
-from typing_extensions import Final
 
 from ...representation import FData, FDataBasis, FDataGrid
 from ...typing._metric import Norm
@@ -1,9 +1,7 @@
 """Typing for norms and metrics."""
 import enum
 from builtins import isinstance
-from typing import Any, TypeVar, Union, overload
-
-from typing_extensions import Final, Literal
+from typing import Any, Final, Literal, TypeVar, Union, overload
 
 from ...typing._metric import Metric
 
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Callable, TypeVar, Union
+from typing import Any, Callable, Protocol, TypeVar, Union
 
 import multimethod
-from typing_extensions import Protocol
 
 from ...representation import FData
 from ...representation.basis import Basis
@@ -4,11 +4,18 @@ from __future__ import annotations
 import math
 import warnings
 from functools import singledispatch
-from typing import Callable, Optional, TypeVar, Union, overload
+from typing import (
+    Callable,
+    Literal,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import numpy as np
 import sklearn.metrics
-from typing_extensions import Literal, Protocol
 
 from .._utils import nquad_vec
 from ..representation import FData, FDataBasis, FDataGrid
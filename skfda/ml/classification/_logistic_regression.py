@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from typing import Callable, Tuple
+from typing import Callable, Literal, Tuple
 
 import numpy as np
 from sklearn.linear_model import LogisticRegression as mvLogisticRegression
 from sklearn.utils.validation import check_is_fitted
-from typing_extensions import Literal
 
 from ..._utils import _classifier_get_classes
 from ..._utils._sklearn_adapter import BaseEstimator, ClassifierMixin
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Sequence, TypeVar, Union, overload
+from typing import Literal, Sequence, TypeVar, Union, overload
 
 from sklearn.neighbors import (
     KNeighborsClassifier as _KNeighborsClassifier,
     RadiusNeighborsClassifier as _RadiusNeighborsClassifier,
 )
-from typing_extensions import Literal
 
 from ..._utils._neighbors_base import (
     AlgorithmType,
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import enum
-from typing import Callable, TypeVar, Union
+from typing import Callable, Literal, TypeVar, Union
 
 import joblib
 import numpy as np
 import sklearn.cluster
-from typing_extensions import Literal
 
 from ..._utils._sklearn_adapter import BaseEstimator, ClusterMixin
 from ...misc.metrics import PRECOMPUTED, PairwiseMetric, l2_distance
@@ -1,9 +1,7 @@
 """Unsupervised learner for implementing neighbor searches."""
 from __future__ import annotations
 
-from typing import Any, TypeVar, Union, overload
-
-from typing_extensions import Literal
+from typing import Any, Literal, TypeVar, Union, overload
 
 from ..._utils._neighbors_base import (
     AlgorithmType,
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import abc
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from typing import Any, Generic, TypeVar
 
 import numpy as np
 
 from ...misc._math import inner_product
-from ...representation.basis import Basis, FDataBasis
+from ...representation.basis import (
+    Basis,
+    BSplineBasis,
+    ConstantBasis,
+    FDataBasis,
+    FourierBasis,
+    MonomialBasis,
+)
 from ...typing._numpy import NDArrayFloat
 
 CovariateType = TypeVar("CovariateType")
@@ -106,6 +113,45 @@ class CoefficientInfoNdarray(CoefficientInfo[NDArrayFloat]):
         return inner_product(coefs, X)
 
 
+# Basis types whose equality and hash take into account all their
+# parameters, so that equal basis have the same inner product matrix
+_CACHEABLE_BASIS_TYPES = frozenset((
+    BSplineBasis,
+    ConstantBasis,
+    FourierBasis,
+    MonomialBasis,
+))
+
+
+@lru_cache(maxsize=32)
+def _cached_inner_product_matrix(basis: Basis, other: Basis) -> NDArrayFloat:
+    # The matrix may be the Gram matrix cached by the basis itself, so a
+    # private copy is stored, read-only as it is shared between all callers
+    matrix = basis.inner_product_matrix(other).copy()
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _basis_inner_product_matrix(basis: Basis, other: Basis) -> NDArrayFloat:
+    """
+    Compute the inner product matrix of two basis, caching the result.
+
+    The covariate and coefficient basis are usually the same across
+    several fits (for example during cross validation), so the matrix,
+    which is expensive to compute, is reused when possible. Only basis
+    whose equality compares every parameter are cached, and the cached
+    matrix is read-only.
+
+    """
+    if (
+        type(basis) in _CACHEABLE_BASIS_TYPES
+        and type(other) in _CACHEABLE_BASIS_TYPES
+    ):
+        return _cached_inner_product_matrix(basis, other)
+
+    return basis.inner_product_matrix(other)
+
+
 class CoefficientInfoFDataBasis(CoefficientInfo[FDataBasis]):
     """
     Information about a FDataBasis coefficient.
@@ -124,7 +170,10 @@ class CoefficientInfoFDataBasis(CoefficientInfo[FDataBasis]):
         # the matrix of inner products.
 
         xcoef = X.coefficients
-        self.inner_basis = X.basis.inner_product_matrix(self.basis)
+        self.inner_basis = _basis_inner_product_matrix(
+            X.basis,
+            self.basis.basis,
+        )
         return xcoef @ self.inner_basis
 
     def convert_from_constant_coefs(  # noqa: D102
@@ -140,6 +189,17 @@ class CoefficientInfoFDataBasis(CoefficientInfo[FDataBasis]):
     ) -> NDArrayFloat:
         # Efficient implementation of the inner product using the
         # inner product matrix previously computed
+        if (
+            isinstance(coefs, FDataBasis)
+            and isinstance(X, FDataBasis)
+            and coefs.n_samples == 1
+        ):
+            # A single coefficient (the usual case) reduces the inner
+            # products to one matrix-vector product
+            return (  # type: ignore[no-any-return]
+                X.coefficients @ (self.inner_basis @ coefs.coefficients[0])
+            )
+
         return inner_product(coefs, X, inner_product_matrix=self.inner_basis.T)
 
 
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Tuple, TypeVar, Union, overload
+from typing import Literal, Tuple, TypeVar, Union, overload
 
 from sklearn.neighbors import (
     KNeighborsRegressor as _KNeighborsRegressor,
     RadiusNeighborsRegressor as _RadiusNeighborsRegressor,
 )
-from typing_extensions import Literal
 
 from ..._utils._neighbors_base import (
     AlgorithmType,
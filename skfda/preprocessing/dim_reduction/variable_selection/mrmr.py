@@ -6,7 +6,9 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Final,
     Generic,
+    Literal,
     Tuple,
     TypeVar,
     Union,
@@ -19,7 +21,6 @@ from sklearn.feature_selection import (
     mutual_info_classif,
     mutual_info_regression,
 )
-from typing_extensions import Final, Literal
 
 from ...._utils._sklearn_adapter import (
     BaseEstimator,
@@ -9,6 +9,7 @@ from typing import (
     Callable,
     Iterable,
     List,
+    Literal,
     Mapping,
     Optional,
     Sequence,
@@ -24,7 +25,6 @@ import numpy.ma as ma
 import scipy.stats
 import sklearn.utils
 from sklearn.base import clone
-from typing_extensions import Literal
 
 from skfda.exploratory.stats.covariance import (
     CovarianceEstimator,
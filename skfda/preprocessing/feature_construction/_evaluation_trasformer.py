@@ -1,10 +1,9 @@
 """Evaluation Transformer Module."""
 from __future__ import annotations
 
-from typing import TypeVar, overload
+from typing import Literal, TypeVar, overload
 
 from sklearn.utils.validation import check_is_fitted
-from typing_extensions import Literal
 
 from ..._utils._sklearn_adapter import BaseEstimator, InductiveTransformerMixin
 from ...representation._functional_data import FData
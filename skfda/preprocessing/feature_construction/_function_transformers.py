@@ -1,9 +1,7 @@
 """Function transformers for feature construction techniques."""
 from __future__ import annotations
 
-from typing import Optional, Sequence, Tuple
-
-from typing_extensions import Literal
+from typing import Literal, Optional, Sequence, Tuple
 
 from ..._utils._sklearn_adapter import BaseEstimator, TransformerMixin
 from ...representation import FData
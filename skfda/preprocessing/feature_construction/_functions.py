@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import itertools
-from typing import Optional, Sequence, Tuple, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import numpy as np
-from typing_extensions import Literal, TypeGuard
 
 from ..._utils.ndfunction._functions import (
     _average_function_ufunc,
@@ -17,6 +25,9 @@ from ...representation import FData, FDataBasis, FDataGrid
 from ...typing._base import DomainRangeLike
 from ...typing._numpy import ArrayLike, NDArrayBool, NDArrayFloat, NDArrayInt
 
+if TYPE_CHECKING:
+    from typing_extensions import TypeGuard
+
 T = TypeVar("T", bound=Union[NDArrayFloat, FDataGrid])
 
 
@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import warnings
-from typing import Callable, Optional, Tuple, TypeVar, Union
+from typing import Callable, Literal, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 from sklearn.utils.validation import check_is_fitted
-from typing_extensions import Literal
 
 from ...misc._math import inner_product
 from ...misc.metrics._lp_norms import l2_norm
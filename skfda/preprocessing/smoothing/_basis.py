@@ -6,10 +6,9 @@ This module contains the class for the basis smoothing.
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Final, Optional
 
 import numpy as np
-from typing_extensions import Final
 
 from ..._utils import _cartesian_product, _to_grid_points
 from ...misc.lstsq import LstsqMethod, solve_regularized_weighted_lstsq
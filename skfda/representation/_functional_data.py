@@ -14,8 +14,10 @@ from typing import (
     Callable,
     Iterable,
     Iterator,
+    Literal,
     NoReturn,
     Optional,
+    Protocol,
     Sequence,
     TypeVar,
     Union,
@@ -26,7 +28,6 @@ from typing import (
 import numpy as np
 import pandas.api.extensions
 from matplotlib.figure import Figure
-from typing_extensions import Literal, Protocol
 
 from .._utils import _evaluate_grid, _to_grid_points
 from ..typing._base import (
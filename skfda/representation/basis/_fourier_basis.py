@@ -1,8 +1,7 @@
 import warnings
-from typing import Any, Optional, Sequence, Tuple, TypeVar
+from typing import Any, Optional, Protocol, Sequence, Tuple, TypeVar
 
 import numpy as np
-from typing_extensions import Protocol
 
 from ...typing._base import DomainRangeLike
 from ...typing._numpy import NDArrayFloat
@@ -8,9 +8,7 @@ evaluation of FDataGrids.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
-
-from typing_extensions import Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from ..typing._base import EvaluationPoints
 from ..typing._numpy import ArrayLike, NDArrayFloat
@@ -5,10 +5,17 @@ Defines methods to evaluate points outside the :term:`domain` range.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, NoReturn, Optional, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    NoReturn,
+    Optional,
+    Union,
+    overload,
+)
 
 import numpy as np
-from typing_extensions import Literal
 
 from ..typing._base import EvaluationPoints
 from ..typing._numpy import NDArrayFloat
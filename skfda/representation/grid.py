@@ -512,14 +512,34 @@ class FDataGrid(FData):  # noqa: WPS214
         else:
             data = self
 
-        integrand = data.data_matrix
+        # Integrate in the same precision as when passing the grid points,
+        # independently of the step being constant
+        integrand = data.data_matrix.astype(
+            np.result_type(data.data_matrix, *data.grid_points),
+            copy=False,
+        )
 
         for g in data.grid_points[::-1]:
-            integrand = scipy.integrate.simpson(
-                integrand,
-                x=g,
-                axis=-2,
-            )
+            spacing = np.diff(g)
+
+            # Simpson's rule is much cheaper with a constant step
+            if len(spacing) > 0 and np.allclose(
+                spacing,
+                spacing[0],
+                rtol=1e-10,
+                atol=0,
+            ):
+                integrand = scipy.integrate.simpson(
+                    integrand,
+                    dx=spacing[0],
+                    axis=-2,
+                )
+            else:
+                integrand = scipy.integrate.simpson(
+                    integrand,
+                    x=g,
+                    axis=-2,
+                )
 
         return integrand
 
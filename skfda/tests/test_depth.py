@@ -43,3 +43,48 @@ class TestsDepthSameCurves(unittest.TestCase):
             depth(self.fd),
             [1, 1, 1, 1, 1],
         )
+
+
+class TestsDepthDistribution(unittest.TestCase):
+    """Test depths with respect to a different distribution."""
+
+    def setUp(self) -> None:
+        """Define the distribution and the evaluated curves."""
+        grid_points = [0, 2, 4, 6, 8, 10]
+
+        self.distribution = skfda.FDataGrid(
+            [
+                [1, 1, 2, 3, 2.5, 2],
+                [0.5, 0.5, 1, 2, 1.5, 1],
+                [-1, -1, -0.5, 1, 1, 0.5],
+                [-0.5, -0.5, -0.5, -1, -1, -1],
+            ],
+            grid_points,
+        )
+        self.fd = skfda.FDataGrid(
+            [
+                [0, 0, 1, 1, 1, 1],
+                [2, 2, 2, 2, 2, 2],
+            ],
+            grid_points,
+        )
+
+    def test_integrated(self) -> None:
+        """Test the Fraiman-Muñiz depth."""
+        depth = IntegratedDepth()
+
+        np.testing.assert_allclose(
+            depth(self.fd, distribution=self.distribution),
+            [0.929167, 0.604167],
+            rtol=1e-5,
+        )
+
+    def test_modified_band_depth(self) -> None:
+        """Test MBD."""
+        depth = ModifiedBandDepth()
+
+        np.testing.assert_allclose(
+            depth(self.fd, distribution=self.distribution),
+            [0.783333, 0.416667],
+            rtol=1e-5,
+        )
@@ -265,6 +265,16 @@ class TestFDataGrid(unittest.TestCase):
         self.assertEqual(gof.dim_domain, 1)
         self.assertEqual(gof.dim_codomain, 1)
 
+    def test_integrate_dtype(self) -> None:
+        """Test that the integral dtype does not depend on the grid."""
+        data_matrix = np.ones((2, 5), dtype=np.float32)
+        uniform = FDataGrid(data_matrix, np.linspace(0, 1, 5))
+        non_uniform = FDataGrid(data_matrix, [0, 0.1, 0.5, 0.7, 1])
+
+        self.assertEqual(uniform.integrate().dtype, np.float64)
+        self.assertEqual(non_uniform.integrate().dtype, np.float64)
+        np.testing.assert_allclose(uniform.integrate(), [[1], [1]])
+
 
 class TestEvaluateFDataGrid(unittest.TestCase):
     """Test FDataGrid evaluation."""
@@ -4,11 +4,14 @@ import unittest
 import numpy as np
 
 from skfda import FDataGrid
+from skfda.exploratory.depth import ModifiedBandDepth
 from skfda.exploratory.depth.multivariate import SimplicialDepth
 from skfda.exploratory.outliers import (
     MSPlotOutlierDetector,
+    OutliergramOutlierDetector,
     directional_outlyingness_stats,
 )
+from skfda.exploratory.stats import modified_epigraph_index
 
 
 class TestsDirectionalOutlyingness(unittest.TestCase):
@@ -71,5 +74,37 @@ class TestsDirectionalOutlyingness(unittest.TestCase):
         )
 
 
+class TestsOutliergram(unittest.TestCase):
+    """Tests for the outliergram outlier detector."""
+
+    def test_mbd_mei(self) -> None:
+        """Test that MBD and MEI match their standalone computations."""
+        data_matrix = [
+            [1, 1, 2, 3, 2.5, 2],
+            [0.5, 1, -1, 3, 2, 1],
+            [0.5, 0.5, 1, 2, 1.5, 1],
+            [-1, -1, -0.5, 5, 5, 0.5],
+            [-0.5, -0.5, -0.5, -1, -1, -1],
+            [0.5, 0.5, 1, 2, 1.5, 1],
+        ]
+        grid_points = [0, 2, 4, 6, 8, 10]
+        fd = FDataGrid(data_matrix, grid_points)
+        out_detector = OutliergramOutlierDetector().fit(fd)
+        np.testing.assert_allclose(
+            out_detector.mbd_,
+            ModifiedBandDepth()(fd),
+        )
+        np.testing.assert_allclose(
+            out_detector.mei_,
+            modified_epigraph_index(fd),
+        )
+
+    def test_vector_valued(self) -> None:
+        """Test that vector valued functions are rejected."""
+        fd = FDataGrid(np.zeros((6, 4, 2)), [2, 4, 6, 8])
+        with np.testing.assert_raises(NotImplementedError):
+            OutliergramOutlierDetector().fit(fd)
+
+
 if __name__ == '__main__':
     unittest.main()
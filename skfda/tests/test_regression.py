@@ -14,10 +14,12 @@ from skfda.misc.covariances import Gaussian
 from skfda.misc.operators import LinearDifferentialOperator
 from skfda.misc.regularization import L2Regularization
 from skfda.ml.regression import HistoricalLinearRegression, LinearRegression
+from skfda.ml.regression._coefficients import _basis_inner_product_matrix
 from skfda.representation.basis import (
     BSplineBasis,
     ConstantBasis,
     FDataBasis,
+    FiniteElementBasis,
     FourierBasis,
     MonomialBasis,
 )
@@ -510,6 +512,40 @@ class TestScalarLinearRegression(unittest.TestCase):
         with np.testing.assert_raises(ValueError):
             scalar.fit([x_fd], y, weights)
 
+    def test_inner_product_matrix_cache(self) -> None:
+        """Test that different basis with equal size are not confused."""
+        cells = np.array([[0, 1], [1, 2]])
+        basis = FiniteElementBasis(
+            vertices=np.array([[0.0], [1.0], [2.0]]),
+            cells=cells,
+        )
+        other_basis = FiniteElementBasis(
+            vertices=np.array([[0.0], [0.2], [2.0]]),
+            cells=cells,
+        )
+
+        np.testing.assert_allclose(
+            _basis_inner_product_matrix(basis, basis),
+            basis.inner_product_matrix(basis),
+        )
+        np.testing.assert_allclose(
+            _basis_inner_product_matrix(other_basis, other_basis),
+            other_basis.inner_product_matrix(other_basis),
+        )
+
+        bspline = BSplineBasis(n_basis=5)
+        matrix = _basis_inner_product_matrix(bspline, bspline)
+        self.assertFalse(matrix.flags.writeable)
+
+    def test_gram_matrix_writeable(self) -> None:
+        """Test that fitting does not lock the Gram matrix of the basis."""
+        basis = BSplineBasis(n_basis=5)
+        x_fd = FDataBasis(basis, np.identity(5))
+        y = np.arange(5)
+
+        LinearRegression(coef_basis=[basis]).fit(x_fd, y)
+        self.assertTrue(basis.gram_matrix().flags.writeable)
+
 
 class TestFunctionalLinearRegression(unittest.TestCase):
     """Tests for linear regression with functional response."""
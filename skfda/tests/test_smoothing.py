@@ -1,11 +1,10 @@
 """Test smoothing methods."""
 import unittest
-from typing import Tuple
+from typing import Literal, Tuple
 
 import numpy as np
 import sklearn
 from sklearn.datasets import load_digits
-from typing_extensions import Literal
 
 import skfda
 import skfda.preprocessing.smoothing as smoothing
@@ -1,8 +1,7 @@
 """Common types."""
-from typing import Optional, Sequence, Tuple, TypeVar, Union
+from typing import Optional, Protocol, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
-from typing_extensions import Protocol
 
 from ._numpy import ArrayLike, NDArrayFloat
 
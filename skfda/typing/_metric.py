@@ -1,8 +1,6 @@
 """Typing for norms and metrics."""
 from abc import abstractmethod
-from typing import TypeVar
-
-from typing_extensions import Protocol
+from typing import Protocol, TypeVar
 
 from ._base import Vector
 from ._numpy import NDArrayFloat